@@ -1,18 +1,26 @@
 import streamlit as st
+import hashlib
 import logging
 from services.matching_service import MatchingService
 from utils.lookup_handler import LookupHandler
 from components.lookup_component import LookupComponent
+from components.results_component import ResultsComponent
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_resource
+def get_matching_service() -> MatchingService:
+    """Load the database, matcher and typeahead index once per server process"""
+    return MatchingService()
+
 class EntityMatchingApp:
     def __init__(self):
-        self.matching_service = MatchingService()
+        self.matching_service = get_matching_service()
         self.lookup_handler = LookupHandler(self.matching_service)
         self.lookup_component = LookupComponent(self.lookup_handler)
+        self.results_component = ResultsComponent(self.matching_service)
         self.setup_page()
     
     def setup_page(self):
@@ -45,6 +53,7 @@ class EntityMatchingApp:
             if st.button("🔄 Refresh Database"):
                 try:
                     self.matching_service.refresh_database()
+                    st.session_state.pop("bulk_results", None)
                     st.success("Database refreshed successfully!")
                 except Exception as e:
                     st.error(f"Error refreshing database: {str(e)}")
@@ -76,10 +85,27 @@ class EntityMatchingApp:
         
         if uploaded_file is not None:
             try:
-                with st.spinner("Processing your entities..."):
-                    processing_result = self.matching_service.process_uploaded_file(uploaded_file)
+                # Process each upload once per database version; paging and filtering
+                # reruns reuse the cached results
+                self.matching_service.refresh_if_stale()
+                upload_key = (
+                    hashlib.sha256(uploaded_file.getvalue()).hexdigest(),
+                    self.matching_service.database_version
+                )
+                cached = st.session_state.get("bulk_results")
+                if cached is None or cached['key'] != upload_key:
+                    with st.spinner("Processing your entities..."):
+                        processing_result = self.matching_service.process_uploaded_file(uploaded_file)
+                        cached = {
+                            'key': upload_key,
+                            'processing_result': processing_result,
+                            'results_df': self.matching_service.get_results_frame(processing_result),
+                            'excel_file': None
+                        }
+                    st.session_state["bulk_results"] = cached
+                    st.session_state["results_page"] = 1
                 
-                self.render_bulk_results(processing_result)
+                self.render_bulk_results(cached)
                 
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
@@ -87,7 +113,10 @@ class EntityMatchingApp:
     
     def render_single_lookup_section(self):
         """Render the single entity lookup section"""
-        search_clicked, search_type, search_value = self.lookup_component.render_lookup_interface()
+        search_clicked, search_type, search_value, typeahead = self.lookup_component.render_lookup_interface()
+        
+        if typeahead and search_value and not search_clicked:
+            self.lookup_component.render_suggestions(search_type, search_value)
         
         if search_clicked:
             if not search_value:
@@ -99,10 +128,12 @@ class EntityMatchingApp:
             
             self.lookup_component.display_lookup_results(result)
     
-    def render_bulk_results(self, processing_result):
-        """Render bulk processing results (existing functionality)"""
+    def render_bulk_results(self, cached_results):
+        """Render bulk processing results from the cached processing run"""
         from utils.file_handlers import FileHandler
         
+        processing_result = cached_results['processing_result']
+        
         st.header("📊 Results")
         
         # Summary statistics
@@ -119,27 +150,23 @@ class EntityMatchingApp:
             success_rate = (summary['matched'] / summary['total_processed']) * 100
             st.metric("Success Rate", f"{success_rate:.1f}%")
         
-        # Matched entities
-        if processing_result.matched_entities:
-            st.subheader("✅ Matched Entities")
-            matched_df = self.matching_service.get_matched_results_df(processing_result)
-            st.dataframe(matched_df, use_container_width=True)
-        else:
+        if not processing_result.matched_entities:
             st.info("No entities were matched.")
         
-        # Unmatched entities
-        if processing_result.unmatched_entities:
-            st.subheader("❌ Unmatched Entities")
-            unmatched_df = self.matching_service.get_unmatched_results_df(processing_result)
-            st.dataframe(unmatched_df, use_container_width=True)
+        # Paged, filterable results (only the visible page is sent to the browser)
+        st.subheader("📋 Entities")
+        self.results_component.render_results_view(cached_results['results_df'])
         
         # Download results
         st.subheader("📥 Download Results")
-        file_handler = FileHandler()
-        excel_file = file_handler.create_results_excel(processing_result, self.matching_service)
+        if cached_results['excel_file'] is None:
+            file_handler = FileHandler()
+            cached_results['excel_file'] = file_handler.create_results_excel(
+                processing_result, self.matching_service
+            ).getvalue()
         st.download_button(
             label="Download Results as Excel",
-            data=excel_file,
+            data=cached_results['excel_file'],
             file_name="entity_matching_results.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
@@ -30,6 +30,12 @@ class LookupComponent:
             # Show description for selected search type
             selected_type_info = next(st for st in search_types if st['value'] == search_type)
             st.caption(f"💡 {selected_type_info['description']}")
+            
+            typeahead = st.toggle(
+                "Live suggestions",
+                value=True,
+                help="Suggest matching entities as you type"
+            )
         
         with col2:
             search_value = st.text_input(
@@ -47,7 +53,32 @@ class LookupComponent:
                 use_container_width=True
             )
         
-        return search_clicked, search_type, search_value
+        return search_clicked, search_type, search_value, typeahead
+    
+    def render_suggestions(self, search_type: str, search_value: str):
+        """Render typeahead suggestions for the current search value"""
+        # Look up each committed query once; other reruns (e.g. paging in the bulk tab)
+        # reuse the result instead of repeating a fuzzy fallback scan
+        matching_service = self.lookup_handler.matching_service
+        matching_service.refresh_if_stale()
+        suggestion_key = (search_type, search_value.strip(), matching_service.database_version)
+        
+        cached = st.session_state.get("typeahead_result")
+        if cached is None or cached['key'] != suggestion_key:
+            cached = {
+                'key': suggestion_key,
+                'result': self.lookup_handler.get_suggestions(search_type, search_value)
+            }
+            st.session_state["typeahead_result"] = cached
+        result = cached['result']
+        
+        if result['suggestions']:
+            label = "Closest match" if result['source'] == 'fuzzy' else "Suggestions"
+            st.write(f"**{label}:**")
+            suggestions_df = pd.DataFrame([entity.to_dict() for entity in result['suggestions']])
+            st.dataframe(suggestions_df, use_container_width=True, hide_index=True)
+        else:
+            st.caption("No suggestions.")
     
     def display_lookup_results(self, result: Dict[str, Any]):
         """Display the results of single entity lookup"""
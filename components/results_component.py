@@ -0,0 +1,101 @@
+import math
+import streamlit as st
+import pandas as pd
+
+class ResultsComponent:
+    """Paged, filterable view over the typed results frame.
+
+    Filtering, sorting and paging run server-side so only the visible page is
+    serialized to the browser.
+    """
+
+    STATUS_OPTIONS = ['All', 'Matched', 'Unmatched']
+    SORT_OPTIONS = ['Input order', 'Match Confidence', 'Input Entity', 'Entity Name']
+    PAGE_SIZE_OPTIONS = [25, 50, 100, 250]
+
+    def __init__(self, matching_service):
+        self.matching_service = matching_service
+
+    def render_results_view(self, results_df: pd.DataFrame):
+        """Render filter controls and the current page of results"""
+        col1, col2, col3 = st.columns([1, 2, 2])
+
+        with col1:
+            status = st.selectbox("Status", options=self.STATUS_OPTIONS, key="results_status")
+
+        with col2:
+            confidence_range = st.slider(
+                "Match Confidence (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=(0.0, 100.0),
+                step=1.0,
+                key="results_confidence"
+            )
+
+        with col3:
+            search = st.text_input(
+                "Search Inputs",
+                placeholder="Filter by input text...",
+                key="results_search"
+            )
+
+        col1, col2, col3 = st.columns([2, 1, 1])
+
+        with col1:
+            sort_by = st.selectbox("Sort By", options=self.SORT_OPTIONS, key="results_sort_by")
+
+        with col2:
+            ascending = st.toggle("Ascending", value=sort_by != 'Match Confidence', key="results_ascending")
+
+        with col3:
+            page_size = st.selectbox("Rows per page", options=self.PAGE_SIZE_OPTIONS, index=1, key="results_page_size")
+
+        query = {
+            'status': None if status == 'All' else status,
+            'confidence_range': confidence_range,
+            'search': search,
+            'sort_by': 'Input Row' if sort_by == 'Input order' else sort_by,
+            'ascending': ascending,
+            'page_size': page_size
+        }
+
+        # A new filter, sort or page size starts again from the first page
+        if st.session_state.get("results_query") != query:
+            st.session_state["results_query"] = query
+            st.session_state["results_page"] = 1
+
+        page = st.session_state.get("results_page", 1)
+        page_df, total_rows = self.matching_service.query_results_frame(results_df, page=page, **query)
+
+        # Filters may shrink the result set below the current page
+        total_pages = max(1, math.ceil(total_rows / page_size))
+        if page > total_pages:
+            page = total_pages
+            st.session_state["results_page"] = page
+            page_df, total_rows = self.matching_service.query_results_frame(results_df, page=page, **query)
+
+        st.dataframe(
+            page_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Match Confidence': st.column_config.NumberColumn(format="%.1f%%")
+            }
+        )
+
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            st.number_input(
+                "Page",
+                min_value=1,
+                max_value=total_pages,
+                step=1,
+                key="results_page"
+            )
+
+        with col2:
+            first_row = (page - 1) * page_size + 1 if total_rows else 0
+            last_row = min(page * page_size, total_rows)
+            st.caption(f"Showing rows {first_row}–{last_row} of {total_rows} (page {page} of {total_pages})")
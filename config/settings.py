@@ -5,12 +5,31 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 MASTER_DB_PATH = DATA_DIR / "Entities.xlsx"
+# Alias/former-name table: a sheet in the master workbook, or a CSV next to it
+ALIAS_SHEET_NAME = "Aliases"
+ALIAS_FILE_NAME = "Aliases.csv"
+SQLITE_DB_PATH = DATA_DIR / "entities.db"
+SHARED_CORPUS_DIR = DATA_DIR / "corpus"
+
+# Storage backend: "excel" (in-memory, default), "sqlite" (on-disk, see core/sqlite_database.py)
+# or "shared" (memory-mapped corpus shared by all workers, see core/shared_corpus.py)
+DB_BACKEND = os.getenv("ENTITY_DB_BACKEND", "excel")
+
+# Number of published shared corpus versions kept on disk
+SHARED_CORPUS_KEEP_VERSIONS = 2
 
 # Matching thresholds
 EXACT_MATCH_THRESHOLD = 100
 FUZZY_MATCH_THRESHOLD = 85
 # HIGH_CONFIDENCE_THRESHOLD = 90
 
+# Number of names streamed per block by the on-disk fuzzy stage
+FUZZY_BLOCK_SIZE = 5000
+
+# Typeahead suggestions in the single-entity lookup
+TYPEAHEAD_LIMIT = 10
+TYPEAHEAD_MIN_FUZZY_CHARS = 3  # shortest query that may fall back to fuzzy scoring
+
 # Supported file types
 SUPPORTED_FILE_TYPES = ["csv", "xlsx", "xls"]
 
@@ -20,5 +39,6 @@ COLUMN_MAPPINGS = {
     "ticker": ["Ticker", "ticker", "Symbol"],
     "isin": ["ISIN", "isin"],
     "lei": ["LEI", "lei"],
-    "entity_id": ["Entity ID", "Company ID", "entity_id"]
+    "entity_id": ["Entity ID", "Company ID", "entity_id"],
+    "alias": ["Alias", "Former Name", "alias"]
 }
\ No newline at end of file
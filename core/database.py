@@ -1,25 +1,41 @@
-import pandas as pd
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterable, List, Optional, Dict, Any
 import logging
 from pathlib import Path
 
 from .models import Entity
-from config.settings import MASTER_DB_PATH, COLUMN_MAPPINGS
+from .matcher import normalize_name
+from config.settings import MASTER_DB_PATH, COLUMN_MAPPINGS, ALIAS_SHEET_NAME, ALIAS_FILE_NAME
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class DatabaseHandler:
     def __init__(self, db_path: Path = MASTER_DB_PATH):
         self.db_path = db_path
         self.entities: List[Entity] = []
+        self.aliases: Dict[str, str] = {}
+        self.alias_index: Dict[str, Entity] = {}
         self.logger = logging.getLogger(__name__)
         self._load_database()
     
     def _load_database(self) -> None:
         """Load entities from Excel file"""
+        # pandas/openpyxl are only needed for Excel I/O; keep them off the core import path
+        import pandas as pd
+        
         try:
             if not self.db_path.exists():
                 raise FileNotFoundError(f"Database file not found: {self.db_path}")
             
-            df = pd.read_excel(self.db_path)
+            # Parse only the master sheet (the first one that isn't the alias sheet) and the alias sheet
+            with pd.ExcelFile(self.db_path) as workbook:
+                master_sheet = next(
+                    (name for name in workbook.sheet_names if name != ALIAS_SHEET_NAME), 0
+                )
+                df = workbook.parse(master_sheet)
+                alias_df = (
+                    workbook.parse(ALIAS_SHEET_NAME, dtype=str) if ALIAS_SHEET_NAME in workbook.sheet_names else None
+                )
             self.logger.info(f"Loaded database with {len(df)} entities")
             
             # Map columns to standard names
@@ -28,11 +44,13 @@ class DatabaseHandler:
             
             self.logger.info(f"Successfully parsed {len(self.entities)} entities")
             
+            self._load_aliases(alias_df)
+            
         except Exception as e:
             self.logger.error(f"Error loading database: {str(e)}")
             raise
     
-    def _map_columns(self, columns: pd.Index) -> Dict[str, str]:
+    def _map_columns(self, columns: Iterable[str]) -> Dict[str, str]:
         """Map various column names to standard names"""
         mapping = {}
         for standard_name, possible_names in COLUMN_MAPPINGS.items():
@@ -42,8 +60,10 @@ class DatabaseHandler:
                     break
         return mapping
     
-    def _parse_entities(self, df: pd.DataFrame, column_mapping: Dict[str, str]) -> List[Entity]:
+    def _parse_entities(self, df: "pd.DataFrame", column_mapping: Dict[str, str]) -> List[Entity]:
         """Parse DataFrame into Entity objects"""
+        import pandas as pd
+        
         entities = []
         
         for _, row in df.iterrows():
@@ -62,10 +82,59 @@ class DatabaseHandler:
         
         return entities
     
+    def _load_aliases(self, alias_df: Optional["pd.DataFrame"]) -> None:
+        """Load the alias table (workbook sheet, else a CSV beside the workbook) into a normalized-alias hash index"""
+        import pandas as pd
+        
+        self.aliases = {}
+        self.alias_index = {}
+        
+        if alias_df is None:
+            alias_path = self.db_path.parent / ALIAS_FILE_NAME
+            if not alias_path.exists():
+                return
+            # Read as text so a blank ID cell doesn't turn the column into floats ('199.0')
+            alias_df = pd.read_csv(alias_path, dtype=str)
+        
+        column_mapping = self._map_columns(alias_df.columns)
+        if 'alias' not in column_mapping or 'entity_id' not in column_mapping:
+            self.logger.warning("Alias table is missing an alias or entity ID column; skipping")
+            return
+        
+        # First entity wins when an ID is duplicated, as in the identifier lookups
+        entities_by_id = {entity.entity_id: entity for entity in reversed(self.entities)}
+        
+        for _, row in alias_df.iterrows():
+            alias, entity_id = row[column_mapping['alias']], row[column_mapping['entity_id']]
+            if pd.isna(alias) or pd.isna(entity_id):
+                continue
+            
+            normalized_alias = normalize_name(str(alias))
+            entity = entities_by_id.get(str(entity_id).strip())
+            if not normalized_alias:
+                self.logger.warning(f"Skipping alias '{alias}': empty after normalization")
+                continue
+            if entity is None:
+                self.logger.warning(f"Skipping alias '{alias}': unknown entity ID {entity_id}")
+                continue
+            
+            self.aliases[normalized_alias] = entity.entity_id
+            self.alias_index[normalized_alias] = entity
+        
+        self.logger.info(f"Loaded {len(self.alias_index)} aliases")
+    
     def get_all_entities(self) -> List[Entity]:
         """Get all entities from database"""
         return self.entities.copy()
     
+    def get_aliases(self) -> Dict[str, str]:
+        """Get the normalized alias -> entity ID table"""
+        return self.aliases.copy()
+    
+    def get_alias_index(self) -> Dict[str, Entity]:
+        """Get the normalized alias -> entity hash index"""
+        return self.alias_index.copy()
+    
     def refresh_database(self) -> None:
         """Reload database from file"""
         self._load_database()
@@ -75,4 +144,12 @@ class DatabaseHandler:
         for entity in self.entities:
             if entity.entity_id == entity_id:
                 return entity
-        return None
\ No newline at end of file
+        return None
+    
+    def get_entity_by_identifier(self, identifier_type: str, value: str) -> Optional[Entity]:
+        """Case-insensitive lookup on a single identifier field"""
+        for entity in self.entities:
+            identifier_field = getattr(entity, identifier_type, None)
+            if identifier_field and str(identifier_field).strip().upper() == value.upper():
+                return entity
+        return None
@@ -1,30 +1,40 @@
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from rapidfuzz import fuzz, process
 import logging
 
 from .models import Entity, MatchResult
-from config.settings import FUZZY_MATCH_THRESHOLD
+from config.settings import FUZZY_MATCH_THRESHOLD, FUZZY_BLOCK_SIZE
+
+CORPORATE_SUFFIXES = ['inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co']
+
+def normalize_name(text: str) -> str:
+    """Normalize text for fuzzy matching (shared with the on-disk importers)"""
+    if not isinstance(text, str):
+        text = str(text)
+    
+    # Convert to lowercase and remove extra spaces
+    text = text.lower().strip()
+    
+    # Remove common corporate suffixes and special characters
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = ' '.join([word for word in text.split() if word not in CORPORATE_SUFFIXES])
+    
+    return text
 
 class EntityMatcher:
-    def __init__(self, entities: List[Entity]):
+    def __init__(self, entities: List[Entity], alias_index: Optional[Dict[str, Entity]] = None):
         self.entities = entities
+        self.alias_index = alias_index or {}
+        # Lower-cased name -> row of its first entity, so exact-name checks are hash lookups
+        self.name_rows: Dict[str, int] = {}
+        for row, entity in enumerate(entities):
+            self.name_rows.setdefault(entity.entity_name.strip().lower(), row)
         self.logger = logging.getLogger(__name__)
     
     def normalize_text(self, text: str) -> str:
         """Normalize text for fuzzy matching"""
-        if not isinstance(text, str):
-            text = str(text)
-        
-        # Convert to lowercase and remove extra spaces
-        text = text.lower().strip()
-        
-        # Remove common corporate suffixes and special characters
-        suffixes = ['inc', 'llc', 'ltd', 'corp', 'corporation', 'company', 'co']
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = ' '.join([word for word in text.split() if word not in suffixes])
-        
-        return text
+        return normalize_name(text)
     
     def preprocess_entity_name(self, input_text: str) -> str:
         """Preprocess entity name by removing location and other noise"""
@@ -62,41 +72,26 @@ class EntityMatcher:
         
         return None
     
-    def fuzzy_match_name(self, input_text: str) -> Optional[Tuple[Entity, float]]:
-        """Perform fuzzy matching on company names with preprocessing"""
-        # Preprocess the input to remove locations, etc.
-        processed_input = self.preprocess_entity_name(input_text)
-        normalized_input = self.normalize_text(processed_input)
-        
-        best_match = None
-        best_score = 0
-        
-        for entity in self.entities:
-            # Exact name match (with original input first)
-            if entity.entity_name.strip().lower() == input_text.strip().lower():
-                return entity, 100.0
-            
-            # Exact name match with processed input
-            if entity.entity_name.strip().lower() == processed_input.strip().lower():
-                return entity, 100.0
-            
-            # Fuzzy matching with processed input
-            normalized_entity_name = self.normalize_text(entity.entity_name)
-            
-            # Use multiple fuzzy matching strategies
-            ratio_score = fuzz.ratio(normalized_input, normalized_entity_name)
-            # partial_score = fuzz.partial_ratio(normalized_input, normalized_entity_name)
-            token_score = fuzz.token_sort_ratio(normalized_input, normalized_entity_name)
-            # token_set_ratio = fuzz.token_set_ratio(normalized_input, normalized_entity_name)
-            
-            # Take the maximum score from different strategies
-            current_score = max(ratio_score, token_score)
-            
-            if current_score > best_score and current_score >= FUZZY_MATCH_THRESHOLD:
-                best_score = current_score
-                best_match = entity
+    def alias_keys(self, input_text: str) -> List[str]:
+        """Normalized forms of the input to look up in the alias table"""
+        keys = [self.normalize_text(input_text), self.normalize_text(self.preprocess_entity_name(input_text))]
+        return [key for i, key in enumerate(keys) if key and key not in keys[:i]]
+    
+    def alias_match(self, input_text: str) -> Optional[Entity]:
+        """Resolve known aliases and former names via the alias hash index"""
+        for key in self.alias_keys(input_text):
+            entity = self.alias_index.get(key)
+            if entity:
+                return entity
+        return None
+    
+    def exact_match_name(self, input_text: str) -> Optional[Entity]:
+        """First entity whose name equals the raw or preprocessed input (case-insensitive)"""
+        input_name = input_text.strip().lower()
+        processed_name = self.preprocess_entity_name(input_text).strip().lower()
         
-        return (best_match, best_score) if best_match else None
+        rows = [self.name_rows[name] for name in (input_name, processed_name) if name in self.name_rows]
+        return self.entities[min(rows)] if rows else None
     
     def get_best_partial_match(self, input_text: str) -> Tuple[Optional[Entity], float]:
         """Get the best partial match even if below threshold"""
@@ -140,24 +135,96 @@ class EntityMatcher:
             return MatchResult(
                 input_entity=input_text,
                 matched_entity=entity,
-                match_confidence=100.0
+                match_confidence=100.0,
+                match_type='exact'
             )
         
-        # Then try fuzzy matching for company names
-        fuzzy_match = self.fuzzy_match_name(input_text)
-        if fuzzy_match:
-            entity, confidence = fuzzy_match
+        # Then exact company name matches (before aliases, whose keys drop corporate suffixes)
+        exact_entity = self.exact_match_name(input_text)
+        if exact_entity:
             return MatchResult(
                 input_entity=input_text,
-                matched_entity=entity,
-                match_confidence=confidence
+                matched_entity=exact_entity,
+                match_confidence=100.0,
+                match_type='exact'
+            )
+        
+        # Then known aliases and former names, before any fuzzy scoring
+        alias_entity = self.alias_match(input_text)
+        if alias_entity:
+            return MatchResult(
+                input_entity=input_text,
+                matched_entity=alias_entity,
+                match_confidence=100.0,
+                match_type='alias'
             )
         
-        # No match found, but get the best partial match for confidence score
+        # Then fuzzy matching for company names: one scan for the best score,
+        # which is a match if it clears the threshold
         partial_match, partial_confidence = self.get_best_partial_match(input_text)
+        if partial_match and partial_confidence >= FUZZY_MATCH_THRESHOLD:
+            return MatchResult(
+                input_entity=input_text,
+                matched_entity=partial_match,
+                match_confidence=partial_confidence,
+                match_type='fuzzy'
+            )
         
         return MatchResult(
             input_entity=input_text,
             matched_entity=None,
             match_confidence=partial_confidence  # Show actual confidence even for no match
-        )
\ No newline at end of file
+        )
+
+class StreamingEntityMatcher(EntityMatcher):
+    """Matcher that queries an on-disk entity store instead of an in-memory list.
+
+    The store must provide ``match_identifier``, ``match_alias``, ``match_exact_name``,
+    ``iter_name_blocks`` and ``get_entity_by_row`` (see ``SQLiteEntityStore``).
+    """
+
+    def __init__(self, store, block_size: int = FUZZY_BLOCK_SIZE):
+        super().__init__([])
+        self.store = store
+        self.block_size = block_size
+    
+    def exact_match_identifiers(self, input_text: str) -> Optional[Tuple[Entity, str]]:
+        """Check for exact matches using the store's identifier indexes"""
+        return self.store.match_identifier(input_text.strip().upper())
+    
+    def alias_match(self, input_text: str) -> Optional[Entity]:
+        """Resolve known aliases and former names via the store's alias index"""
+        keys = self.alias_keys(input_text)
+        return self.store.match_alias(*keys) if keys else None
+    
+    def exact_match_name(self, input_text: str) -> Optional[Entity]:
+        """Exact name lookup via the store's name index"""
+        return self.store.match_exact_name(
+            input_text.strip().lower(), self.preprocess_entity_name(input_text).strip().lower()
+        )
+    
+    def get_best_partial_match(self, input_text: str) -> Tuple[Optional[Entity], float]:
+        """Stream normalized names from the store in one pass and return the best scoring entity"""
+        processed_input = self.preprocess_entity_name(input_text)
+        normalized_input = self.normalize_text(processed_input)
+        
+        best_row = None
+        best_score = 0
+        
+        for block in self.store.iter_name_blocks(self.block_size):
+            names = [normalized_name for _, normalized_name in block]
+            
+            # max(ratio, token_sort_ratio) over the block is the larger of each scorer's
+            # best; on a tie the earlier row wins, as in a row-by-row scan
+            candidates = [
+                process.extractOne(normalized_input, names, scorer=scorer)
+                for scorer in (fuzz.ratio, fuzz.token_sort_ratio)
+            ]
+            _, score, index = max(candidates, key=lambda candidate: (candidate[1], -candidate[2]))
+            
+            if score > best_score:
+                best_score = score
+                best_row = block[index][0]
+        
+        best_match = self.store.get_entity_by_row(best_row) if best_row is not None else None
+        return best_match, best_score
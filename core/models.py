@@ -1,6 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+# Identifier columns, in the order exact identifier matching checks them
+IDENTIFIER_FIELDS = ['isin', 'ticker', 'lei', 'entity_id']
+
+def normalize_identifier(value: Optional[str]) -> Optional[str]:
+    """Upper-cased, stripped identifier, or None when blank"""
+    if not value:
+        return None
+    return value.strip().upper() or None
+
 @dataclass
 class Entity:
     entity_id: str
@@ -23,7 +32,8 @@ class MatchResult:
     input_entity: str
     matched_entity: Optional[Entity]
     match_confidence: float
-    # match_type: str  # 'exact', 'fuzzy', 'none'
+    match_type: str = 'none'  # 'exact', 'alias', 'fuzzy', 'none'
+    input_row: Optional[int] = None  # 1-based position in the submitted input list
     # matched_field: str
     
     def is_match_found(self) -> bool:
@@ -0,0 +1,112 @@
+import re
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .models import Entity, IDENTIFIER_FIELDS, normalize_identifier
+from .matcher import normalize_name, CORPORATE_SUFFIXES
+
+
+def name_word_keys(normalized_name: str) -> List[str]:
+    """Word-start keys of a normalized name ("a b c" -> ["b c", "c"])"""
+    words = normalized_name.split()
+    return [' '.join(words[i:]) for i in range(1, len(words))]
+
+
+def name_prefixes(query: str) -> List[str]:
+    """Normalized query prefixes, tolerating a half-typed corporate suffix"""
+    cleaned = ' '.join(re.sub(r'[^\w\s]', ' ', query.lower()).split())
+    prefixes = [normalize_name(query)]
+
+    # "microsoft co" is probably "microsoft corporation" on its way, which
+    # normalizes to "microsoft"; also search without the partial last word
+    words = cleaned.split()
+    if len(words) > 1 and any(suffix.startswith(words[-1]) for suffix in CORPORATE_SUFFIXES):
+        prefixes.append(normalize_name(' '.join(words[:-1])))
+
+    return [prefix for i, prefix in enumerate(prefixes) if prefix and prefix not in prefixes[:i]]
+
+
+def suggest_rows(iter_prefix: Callable[[str, str], Iterable[int]], search_type: str,
+                 query: str, limit: int) -> List[int]:
+    """Rows for the top ``limit`` typeahead suggestions.
+
+    ``iter_prefix(index, prefix)`` yields rows whose key in ``index`` starts
+    with ``prefix``, in (key, row) order. Indexes are ``'name'`` (full
+    normalized names), ``'word'`` (word starts) and the upper-cased identifier
+    fields. Full-name prefix hits rank ahead of word-start hits.
+    """
+    if not query or not query.strip():
+        return []
+
+    if search_type == 'entity_name':
+        indexes, prefixes = ['name', 'word'], name_prefixes(query)
+    elif search_type in IDENTIFIER_FIELDS:
+        indexes, prefixes = [search_type], [query.strip().upper()]
+    else:
+        raise ValueError(f"Unsupported search type: {search_type}")
+
+    rows = []
+    for index in indexes:
+        for prefix in prefixes:
+            for row in iter_prefix(index, prefix):
+                if row in rows:
+                    continue
+                rows.append(row)
+                if len(rows) >= limit:
+                    return rows
+    return rows
+
+
+class SortedPrefixIndex:
+    """Sorted key array searched with ``bisect`` for all keys sharing a prefix"""
+
+    def __init__(self, pairs: List[Tuple[str, int]]):
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.rows = [row for _, row in pairs]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def iter_prefix(self, prefix: str):
+        """Yield ``(key, row)`` for every key starting with ``prefix``, in key order"""
+        i = bisect_left(self.keys, prefix)
+        while i < len(self.keys) and self.keys[i].startswith(prefix):
+            yield self.keys[i], self.rows[i]
+            i += 1
+
+
+class EntityPrefixIndex:
+    """In-memory typeahead index over normalized entity names and identifiers.
+
+    Names are indexed by their full normalized form and by every word start
+    (so "business mach" finds "International Business Machines"). The SQLite
+    and shared-corpus backends serve the same keys from their own storage.
+    """
+
+    def __init__(self, entities: List[Entity]):
+        self.entities = entities
+
+        name_pairs = []
+        word_pairs = []
+        for row, entity in enumerate(entities):
+            normalized = normalize_name(entity.entity_name)
+            if not normalized:
+                continue
+            name_pairs.append((normalized, row))
+            word_pairs.extend((key, row) for key in name_word_keys(normalized))
+
+        self.indexes: Dict[str, SortedPrefixIndex] = {
+            'name': SortedPrefixIndex(name_pairs),
+            'word': SortedPrefixIndex(word_pairs),
+        }
+        for field in IDENTIFIER_FIELDS:
+            keys = [normalize_identifier(getattr(entity, field)) for entity in entities]
+            self.indexes[field] = SortedPrefixIndex([(key, row) for row, key in enumerate(keys) if key])
+
+    def _iter_prefix(self, index: str, prefix: str) -> Iterable[int]:
+        return (row for _, row in self.indexes[index].iter_prefix(prefix))
+
+    def suggest(self, search_type: str, query: str, limit: int = 10) -> List[Entity]:
+        """Top ``limit`` entities whose name or ``search_type`` identifier starts with ``query``"""
+        return [self.entities[row] for row in suggest_rows(self._iter_prefix, search_type, query, limit)]
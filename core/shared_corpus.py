@@ -0,0 +1,406 @@
+import argparse
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .models import Entity, IDENTIFIER_FIELDS, normalize_identifier
+from .matcher import normalize_name
+from .prefix_index import name_word_keys, suggest_rows
+from config.settings import MASTER_DB_PATH, SHARED_CORPUS_DIR, SHARED_CORPUS_KEEP_VERSIONS
+
+MAGIC = b"ECCORPUS"
+FORMAT_VERSION = 1  # bump when the section layout changes; readers refuse other formats
+POINTER_FILE = "CURRENT"
+SEGMENT_PATTERN = re.compile(r"^corpus-v(\d+)\.bin$")
+
+STRING_COLUMNS = ['entity_id', 'entity_name', 'ticker', 'isin', 'lei', 'normalized_name']
+INDEX_FIELDS = IDENTIFIER_FIELDS + ['name_lower']
+
+# Segment index backing each typeahead prefix index
+PREFIX_INDEXES = {'name': 'normalized_name', 'word': 'name_words', **{field: field for field in IDENTIFIER_FIELDS}}
+
+
+def _string_table(values: List[bytes]) -> Tuple[bytes, bytes]:
+    """Encode values as a uint64 offsets array (n + 1 entries) and a data blob"""
+    offsets = array('Q', [0])
+    for value in values:
+        offsets.append(offsets[-1] + len(value))
+    return offsets.tobytes(), b''.join(values)
+
+
+def _index_sections(name: str, pairs: List[Tuple[bytes, int]]) -> Dict[str, bytes]:
+    """Sorted (key, row) pairs; a binary search on the key finds the earliest row"""
+    pairs = sorted(pairs)
+    offsets, data = _string_table([key for key, _ in pairs])
+    return {
+        f"idx.{name}.offsets": offsets,
+        f"idx.{name}.data": data,
+        f"idx.{name}.rows": array('I', [row for _, row in pairs]).tobytes(),
+    }
+
+
+def _build_sections(entities: List[Entity], aliases: Dict[str, str]) -> Dict[str, bytes]:
+    sections = {}
+    normalized_names = [normalize_name(entity.entity_name) for entity in entities]
+
+    for column in STRING_COLUMNS:
+        if column == 'normalized_name':
+            values = normalized_names
+        else:
+            values = [getattr(entity, column) or '' for entity in entities]
+        sections[f"{column}.offsets"], sections[f"{column}.data"] = _string_table(
+            [value.encode('utf-8') for value in values]
+        )
+
+    for field in INDEX_FIELDS:
+        if field == 'name_lower':
+            keys = [entity.entity_name.strip().lower() for entity in entities]
+        else:
+            keys = [normalize_identifier(getattr(entity, field)) for entity in entities]
+        sections.update(_index_sections(
+            field, [(key.encode('utf-8'), row) for row, key in enumerate(keys) if key]
+        ))
+
+    sections.update(_index_sections('normalized_name', [
+        (name.encode('utf-8'), row) for row, name in enumerate(normalized_names) if name
+    ]))
+    sections.update(_index_sections('name_words', [
+        (key.encode('utf-8'), row)
+        for row, name in enumerate(normalized_names) for key in name_word_keys(name)
+    ]))
+
+    first_row_by_id = {}
+    for row, entity in enumerate(entities):
+        first_row_by_id.setdefault(entity.entity_id, row)
+    sections.update(_index_sections('alias', [
+        (alias.encode('utf-8'), first_row_by_id[entity_id])
+        for alias, entity_id in aliases.items() if entity_id in first_row_by_id
+    ]))
+
+    return sections
+
+
+def _write_segment(path: Path, entities: List[Entity], aliases: Dict[str, str], version: int) -> None:
+    sections = _build_sections(entities, aliases)
+
+    # Lay out sections after the header, each aligned to 8 bytes so the
+    # offsets/rows arrays can be cast in place by readers
+    layout = {}
+    position = 0
+    for name, payload in sections.items():
+        layout[name] = [position, len(payload)]
+        position += len(payload) + (-len(payload) % 8)
+
+    header = json.dumps({
+        'format': FORMAT_VERSION,
+        'version': version,
+        'count': len(entities),
+        'byteorder': sys.byteorder,
+        'sections': layout,
+    }).encode('utf-8')
+    header += b' ' * (-(len(MAGIC) + 8 + len(header)) % 8)
+    base = len(MAGIC) + 8 + len(header)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for name, payload in sections.items():
+            if f.tell() != base + layout[name][0]:
+                raise RuntimeError(f"Corpus section {name} written at the wrong offset: {path}")
+            f.write(payload)
+            f.write(b'\0' * (-len(payload) % 8))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _segment_versions(corpus_dir: Path) -> List[Tuple[int, Path]]:
+    versions = []
+    for path in corpus_dir.glob("corpus-v*.bin"):
+        match = SEGMENT_PATTERN.match(path.name)
+        if match:
+            versions.append((int(match.group(1)), path))
+    return sorted(versions)
+
+
+def publish_corpus(entities: List[Entity], corpus_dir: Path = SHARED_CORPUS_DIR,
+                   keep_versions: int = SHARED_CORPUS_KEEP_VERSIONS,
+                   aliases: Optional[Dict[str, str]] = None) -> Path:
+    """Write a new corpus segment and point ``CURRENT`` at it.
+
+    ``aliases`` maps normalized aliases to entity IDs (``DatabaseHandler.get_aliases``).
+
+    Attached workers keep reading their current segment until they refresh.
+    Older segments beyond ``keep_versions`` are unlinked; on POSIX an unlinked
+    file stays mapped for any process still attached to it.
+    """
+    logger = logging.getLogger(__name__)
+    corpus_dir = Path(corpus_dir)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    existing = _segment_versions(corpus_dir)
+    version = existing[-1][0] + 1 if existing else 1
+    segment_path = corpus_dir / f"corpus-v{version:06d}.bin"
+
+    tmp_path = segment_path.with_name(segment_path.name + ".tmp")
+    _write_segment(tmp_path, entities, aliases or {}, version)
+    os.replace(tmp_path, segment_path)
+
+    pointer_tmp = corpus_dir / (POINTER_FILE + ".tmp")
+    pointer_tmp.write_text(segment_path.name)
+    os.replace(pointer_tmp, corpus_dir / POINTER_FILE)
+    logger.info(f"Published corpus version {version} with {len(entities)} entities")
+
+    for old_version, old_path in _segment_versions(corpus_dir)[:-keep_versions]:
+        try:
+            old_path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not remove corpus version {old_version}: {str(e)}")
+
+    return segment_path
+
+
+class SharedCorpus:
+    """Read-only, zero-copy view of one published corpus segment.
+
+    Every worker process maps the same file, so the OS page cache holds a
+    single copy of the corpus no matter how many workers attach. Implements
+    the store interface used by ``StreamingEntityMatcher``.
+    """
+
+    def __init__(self, segment_path: Path):
+        self.segment_path = Path(segment_path)
+        with open(self.segment_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        if bytes(self._buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"Not a corpus segment: {self.segment_path}")
+        header_len = struct.unpack('<Q', self._buffer[len(MAGIC):len(MAGIC) + 8])[0]
+        base = len(MAGIC) + 8
+        header = json.loads(bytes(self._buffer[base:base + header_len]))
+        base += header_len
+
+        if header.get('format') != FORMAT_VERSION:
+            raise ValueError(
+                f"Corpus segment format {header.get('format')} is not {FORMAT_VERSION}: {self.segment_path} "
+                f"(republish with `python -m core.shared_corpus`)"
+            )
+        if header['byteorder'] != sys.byteorder:
+            raise ValueError(f"Corpus segment byte order mismatch: {self.segment_path}")
+
+        self.version: int = header['version']
+        self.count: int = header['count']
+        self._views: Dict[str, memoryview] = {}
+        for name, (offset, length) in header['sections'].items():
+            view = self._buffer[base + offset:base + offset + length]
+            if name.endswith('.offsets'):
+                view = view.cast('Q')
+            elif name.endswith('.rows'):
+                view = view.cast('I')
+            self._views[name] = view
+
+    @classmethod
+    def attach(cls, corpus_dir: Path = SHARED_CORPUS_DIR) -> "SharedCorpus":
+        """Attach to the segment that ``CURRENT`` points at"""
+        return cls(current_segment_path(corpus_dir))
+
+    def close(self) -> None:
+        """Release the mapping (only safe once no other thread is reading)"""
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        self._buffer.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _string(self, prefix: str, i: int) -> str:
+        offsets = self._views[f"{prefix}.offsets"]
+        return bytes(self._views[f"{prefix}.data"][offsets[i]:offsets[i + 1]]).decode('utf-8')
+
+    def get_entity(self, row: int) -> Entity:
+        """Materialize a single entity"""
+        values = {column: self._string(column, row) for column in STRING_COLUMNS[:5]}
+        return Entity(
+            entity_id=values['entity_id'],
+            entity_name=values['entity_name'],
+            ticker=values['ticker'] or None,
+            isin=values['isin'] or None,
+            lei=values['lei'] or None
+        )
+
+    def _index_key(self, index: str, i: int) -> bytes:
+        offsets = self._views[f"idx.{index}.offsets"]
+        return bytes(self._views[f"idx.{index}.data"][offsets[i]:offsets[i + 1]])
+
+    def _lower_bound(self, index: str, target: bytes) -> int:
+        """Position of the first key >= ``target`` in a sorted index (binary search in place)"""
+        lo, hi = 0, len(self._views[f"idx.{index}.rows"])
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._index_key(index, mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def iter_rows(self, field: str, key: str) -> Iterator[int]:
+        """Rows whose ``field`` index key equals ``key``, in row order"""
+        target = key.encode('utf-8')
+        rows = self._views[f"idx.{field}.rows"]
+        i = self._lower_bound(field, target)
+        while i < len(rows) and self._index_key(field, i) == target:
+            yield rows[i]
+            i += 1
+
+    def iter_prefix(self, index: str, prefix: str) -> Iterator[int]:
+        """Rows whose typeahead key starts with ``prefix``, in (key, row) order"""
+        field = PREFIX_INDEXES[index]
+        target = prefix.encode('utf-8')
+        rows = self._views[f"idx.{field}.rows"]
+        i = self._lower_bound(field, target)
+        while i < len(rows) and self._index_key(field, i).startswith(target):
+            yield rows[i]
+            i += 1
+
+    def suggest(self, search_type: str, query: str, limit: int = 10) -> List[Entity]:
+        """Top ``limit`` typeahead suggestions, binary-searched in the mapped segment"""
+        return [self.get_entity(row) for row in suggest_rows(self.iter_prefix, search_type, query, limit)]
+
+    def find_row(self, field: str, key: str) -> Optional[int]:
+        """Earliest row whose ``field`` index key equals ``key``"""
+        return next(self.iter_rows(field, key), None)
+
+    def iter_name_blocks(self, block_size: int) -> Iterator[List[Tuple[int, str]]]:
+        """Stream ``(row, normalized_name)`` pairs in blocks of ``block_size``"""
+        for start in range(0, self.count, block_size):
+            stop = min(start + block_size, self.count)
+            yield [(row, self._string('normalized_name', row)) for row in range(start, stop)]
+
+    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+        """Get entity by exact (case-sensitive) ID, scanning the case-insensitive key range"""
+        for row in self.iter_rows('entity_id', normalize_identifier(entity_id) or ''):
+            if self._string('entity_id', row) == entity_id:
+                return self.get_entity(row)
+        return None
+
+    def get_entity_by_identifier(self, identifier_type: str, value: str) -> Optional[Entity]:
+        """Case-insensitive lookup on a single identifier field"""
+        if identifier_type not in IDENTIFIER_FIELDS:
+            raise ValueError(f"Unsupported identifier type: {identifier_type}")
+        row = self.find_row(identifier_type, normalize_identifier(value) or '')
+        return self.get_entity(row) if row is not None else None
+
+    def get_entity_by_row(self, row: int) -> Optional[Entity]:
+        """Get entity by its storage row"""
+        return self.get_entity(row)
+
+    def match_identifier(self, normalized_input: str) -> Optional[Tuple[Entity, str]]:
+        """First entity whose ISIN, ticker, LEI or entity ID equals the (upper-cased) input"""
+        best = None
+        for field in IDENTIFIER_FIELDS:
+            row = self.find_row(field, normalized_input)
+            if row is not None and (best is None or row < best[0]):
+                best = (row, field)
+        return (self.get_entity(best[0]), best[1]) if best else None
+
+    def match_alias(self, *normalized_aliases: str) -> Optional[Entity]:
+        """Entity for the first normalized alias found in the alias index"""
+        for alias in normalized_aliases:
+            row = self.find_row('alias', alias)
+            if row is not None:
+                return self.get_entity(row)
+        return None
+
+    def match_exact_name(self, *names: str) -> Optional[Entity]:
+        """First entity whose stripped, lower-cased name equals any of the given names"""
+        rows = [row for row in (self.find_row('name_lower', name) for name in names) if row is not None]
+        return self.get_entity(min(rows)) if rows else None
+
+
+def current_segment_path(corpus_dir: Path = SHARED_CORPUS_DIR) -> Path:
+    """Resolve the segment that ``CURRENT`` points at"""
+    corpus_dir = Path(corpus_dir)
+    pointer = corpus_dir / POINTER_FILE
+    if not pointer.exists():
+        raise FileNotFoundError(
+            f"No published corpus in {corpus_dir} (publish one with `python -m core.shared_corpus`)"
+        )
+    return corpus_dir / pointer.read_text().strip()
+
+
+class SharedCorpusHandler:
+    """``DatabaseHandler``-compatible wrapper around the current shared corpus segment.
+
+    ``refresh_database`` attaches to the newest published version. The previous
+    mapping is not closed explicitly: matchers built on it keep their own
+    reference and the segment is unmapped once the last one is dropped.
+    """
+
+    def __init__(self, corpus_dir: Path = SHARED_CORPUS_DIR):
+        self.corpus_dir = Path(corpus_dir)
+        self.corpus: Optional[SharedCorpus] = None
+        self.logger = logging.getLogger(__name__)
+        self._load_database()
+
+    def _load_database(self) -> None:
+        """Attach to the current corpus segment"""
+        try:
+            if self.corpus is not None and not self.is_stale():
+                return
+
+            self.corpus = SharedCorpus(current_segment_path(self.corpus_dir))
+            self.logger.info(
+                f"Attached to corpus version {self.corpus.version} with {len(self.corpus)} entities"
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error loading database: {str(e)}")
+            raise
+
+    def is_stale(self) -> bool:
+        """Whether a newer corpus version has been published"""
+        return current_segment_path(self.corpus_dir) != self.corpus.segment_path
+
+    def get_all_entities(self) -> List[Entity]:
+        """Get all entities from database (materializes the full master)"""
+        corpus = self.corpus
+        return [corpus.get_entity(row) for row in range(len(corpus))]
+
+    def refresh_database(self) -> None:
+        """Attach to the newest published corpus version"""
+        self._load_database()
+
+    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+        """Get entity by ID"""
+        return self.corpus.get_entity_by_id(entity_id)
+
+    def get_entity_by_identifier(self, identifier_type: str, value: str) -> Optional[Entity]:
+        """Case-insensitive lookup on a single identifier field"""
+        return self.corpus.get_entity_by_identifier(identifier_type, value)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Publish a new shared corpus version")
+    parser.add_argument("--excel", type=Path, default=MASTER_DB_PATH, help="Source Excel workbook")
+    parser.add_argument("--sqlite", type=Path, help="Read entities from a SQLite master instead")
+    parser.add_argument("--dir", type=Path, default=SHARED_CORPUS_DIR, help="Corpus directory")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        from .sqlite_database import SQLiteDatabaseHandler
+        source = SQLiteDatabaseHandler(args.sqlite)
+    else:
+        from .database import DatabaseHandler
+        source = DatabaseHandler(args.excel)
+    publish_corpus(source.get_all_entities(), args.dir, aliases=source.get_aliases())
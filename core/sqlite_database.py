@@ -0,0 +1,324 @@
+import argparse
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .models import Entity, IDENTIFIER_FIELDS, normalize_identifier
+from .matcher import normalize_name
+from .prefix_index import name_word_keys, suggest_rows
+from config.settings import MASTER_DB_PATH, SQLITE_DB_PATH
+
+# Bump when SCHEMA changes; stores refuse files built for another version
+SCHEMA_VERSION = 1
+
+ENTITY_COLUMNS = "row_id, entity_id, entity_name, ticker, isin, lei"
+ALIASED_ENTITY_COLUMNS = "e.row_id, e.entity_id, e.entity_name, e.ticker, e.isin, e.lei"
+
+SCHEMA = """
+CREATE TABLE entities (
+    row_id INTEGER PRIMARY KEY,
+    entity_id TEXT NOT NULL,
+    entity_name TEXT NOT NULL,
+    ticker TEXT,
+    isin TEXT,
+    lei TEXT,
+    entity_id_upper TEXT,
+    ticker_upper TEXT,
+    isin_upper TEXT,
+    lei_upper TEXT,
+    name_lower TEXT,
+    normalized_name TEXT
+);
+CREATE INDEX idx_entities_entity_id ON entities (entity_id);
+CREATE INDEX idx_entities_entity_id_upper ON entities (entity_id_upper);
+CREATE INDEX idx_entities_ticker_upper ON entities (ticker_upper);
+CREATE INDEX idx_entities_isin_upper ON entities (isin_upper);
+CREATE INDEX idx_entities_lei_upper ON entities (lei_upper);
+CREATE INDEX idx_entities_name_lower ON entities (name_lower);
+CREATE INDEX idx_entities_normalized_name ON entities (normalized_name);
+CREATE TABLE name_words (
+    word_key TEXT NOT NULL,
+    row_id INTEGER NOT NULL
+);
+CREATE INDEX idx_name_words_word_key ON name_words (word_key, row_id);
+CREATE TABLE aliases (
+    alias TEXT PRIMARY KEY,
+    entity_id TEXT NOT NULL
+);
+"""
+
+
+# Typeahead key ranges served by each prefix index: (table, key column)
+PREFIX_INDEXES = {
+    'name': ('entities', 'normalized_name'),
+    'word': ('name_words', 'word_key'),
+    'ticker': ('entities', 'ticker_upper'),
+    'isin': ('entities', 'isin_upper'),
+    'lei': ('entities', 'lei_upper'),
+    'entity_id': ('entities', 'entity_id_upper'),
+}
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with ``prefix``"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SQLiteEntityStore:
+    """Read-only view of one SQLite master file through a single connection.
+
+    Implements the store interface used by ``StreamingEntityMatcher``. The
+    connection is closed when the store is garbage collected, so matchers and
+    in-flight scans holding a store are unaffected by a handler refresh.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        schema_version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version != SCHEMA_VERSION:
+            self.conn.close()
+            raise ValueError(
+                f"{self.db_path} has schema version {schema_version}, expected {SCHEMA_VERSION} "
+                f"(re-run `python -m core.sqlite_database`)"
+            )
+
+    @staticmethod
+    def _row_to_entity(row: Tuple) -> Entity:
+        _, entity_id, entity_name, ticker, isin, lei = row
+        return Entity(entity_id=entity_id, entity_name=entity_name, ticker=ticker, isin=isin, lei=lei)
+
+    def count_entities(self) -> int:
+        """Number of entities in the database"""
+        return self.conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def get_all_entities(self) -> List[Entity]:
+        """Get all entities from database (materializes the full master)"""
+        rows = self.conn.execute(f"SELECT {ENTITY_COLUMNS} FROM entities ORDER BY row_id")
+        return [self._row_to_entity(row) for row in rows]
+
+    def get_aliases(self) -> Dict[str, str]:
+        """Get the normalized alias -> entity ID table"""
+        return dict(self.conn.execute("SELECT alias, entity_id FROM aliases"))
+
+    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+        """Get entity by ID"""
+        row = self.conn.execute(
+            f"SELECT {ENTITY_COLUMNS} FROM entities WHERE entity_id = ? ORDER BY row_id LIMIT 1",
+            (entity_id,)
+        ).fetchone()
+        return self._row_to_entity(row) if row else None
+
+    def get_entity_by_identifier(self, identifier_type: str, value: str) -> Optional[Entity]:
+        """Case-insensitive lookup on a single identifier column"""
+        if identifier_type not in IDENTIFIER_FIELDS:
+            raise ValueError(f"Unsupported identifier type: {identifier_type}")
+
+        row = self.conn.execute(
+            f"SELECT {ENTITY_COLUMNS} FROM entities WHERE {identifier_type}_upper = ? "
+            f"ORDER BY row_id LIMIT 1",
+            (normalize_identifier(value),)
+        ).fetchone()
+        return self._row_to_entity(row) if row else None
+
+    def get_entity_by_row(self, row_id: int) -> Optional[Entity]:
+        """Get entity by its storage row"""
+        row = self.conn.execute(
+            f"SELECT {ENTITY_COLUMNS} FROM entities WHERE row_id = ?", (row_id,)
+        ).fetchone()
+        return self._row_to_entity(row) if row else None
+
+    def match_identifier(self, normalized_input: str) -> Optional[Tuple[Entity, str]]:
+        """First entity whose ISIN, ticker, LEI or entity ID equals the (upper-cased) input"""
+        row = self.conn.execute(
+            f"SELECT {ENTITY_COLUMNS}, isin_upper, ticker_upper, lei_upper, entity_id_upper "
+            f"FROM entities WHERE isin_upper = ?1 OR ticker_upper = ?1 OR lei_upper = ?1 "
+            f"OR entity_id_upper = ?1 ORDER BY row_id LIMIT 1",
+            (normalized_input,)
+        ).fetchone()
+        if not row:
+            return None
+
+        entity = self._row_to_entity(row[:6])
+        for field, value in zip(IDENTIFIER_FIELDS, row[6:]):
+            if value == normalized_input:
+                return entity, field
+        return None
+
+    def match_alias(self, *normalized_aliases: str) -> Optional[Entity]:
+        """Entity for the first normalized alias found in the alias table"""
+        for alias in normalized_aliases:
+            row = self.conn.execute(
+                f"SELECT {ALIASED_ENTITY_COLUMNS} FROM aliases a JOIN entities e ON e.entity_id = a.entity_id "
+                f"WHERE a.alias = ? ORDER BY e.row_id LIMIT 1",
+                (alias,)
+            ).fetchone()
+            if row:
+                return self._row_to_entity(row)
+        return None
+
+    def match_exact_name(self, *names: str) -> Optional[Entity]:
+        """First entity whose stripped, lower-cased name equals any of the given names"""
+        placeholders = ', '.join('?' for _ in names)
+        row = self.conn.execute(
+            f"SELECT {ENTITY_COLUMNS} FROM entities WHERE name_lower IN ({placeholders}) "
+            f"ORDER BY row_id LIMIT 1",
+            names
+        ).fetchone()
+        return self._row_to_entity(row) if row else None
+
+    def iter_name_blocks(self, block_size: int) -> Iterator[List[Tuple[int, str]]]:
+        """Stream ``(row_id, normalized_name)`` pairs in blocks of ``block_size``"""
+        cursor = self.conn.execute("SELECT row_id, normalized_name FROM entities ORDER BY row_id")
+        try:
+            while True:
+                block = cursor.fetchmany(block_size)
+                if not block:
+                    break
+                yield block
+        finally:
+            cursor.close()
+
+    def _iter_prefix(self, index: str, prefix: str) -> Iterator[int]:
+        """Rows whose key starts with ``prefix``, via an index range scan"""
+        table, column = PREFIX_INDEXES[index]
+        cursor = self.conn.execute(
+            f"SELECT row_id FROM {table} WHERE {column} >= ? AND {column} < ? ORDER BY {column}, row_id",
+            (prefix, _prefix_upper_bound(prefix))
+        )
+        try:
+            for (row_id,) in cursor:
+                yield row_id
+        finally:
+            cursor.close()
+
+    def suggest(self, search_type: str, query: str, limit: int = 10) -> List[Entity]:
+        """Top ``limit`` typeahead suggestions served from the on-disk indexes"""
+        rows = suggest_rows(self._iter_prefix, search_type, query, limit)
+        return [self.get_entity_by_row(row_id) for row_id in rows]
+
+
+class SQLiteDatabaseHandler:
+    """Out-of-core alternative to ``DatabaseHandler`` backed by an indexed SQLite file.
+
+    Identifier and exact-name lookups go to on-disk indexes and the fuzzy stage
+    streams normalized names in blocks (see ``StreamingEntityMatcher``), so the
+    master never has to be held in memory. Build the file with
+    ``import_excel_to_sqlite``.
+
+    ``refresh_database`` opens a new ``SQLiteEntityStore`` rather than closing
+    the current connection: matchers built on the previous store keep using it
+    until they are dropped.
+    """
+
+    def __init__(self, db_path: Path = SQLITE_DB_PATH):
+        self.db_path = Path(db_path)
+        self.store: Optional[SQLiteEntityStore] = None
+        self.logger = logging.getLogger(__name__)
+        self._load_database()
+
+    def _load_database(self) -> None:
+        """Open a new read-only store on the SQLite file"""
+        try:
+            if not self.db_path.exists():
+                raise FileNotFoundError(
+                    f"SQLite database not found: {self.db_path} "
+                    f"(build it with `python -m core.sqlite_database`)"
+                )
+
+            self.store = SQLiteEntityStore(self.db_path)
+            self.logger.info(f"Opened SQLite database with {self.store.count_entities()} entities")
+
+        except Exception as e:
+            self.logger.error(f"Error loading database: {str(e)}")
+            raise
+
+    def get_all_entities(self) -> List[Entity]:
+        """Get all entities from database (materializes the full master)"""
+        return self.store.get_all_entities()
+
+    def get_aliases(self) -> Dict[str, str]:
+        """Get the normalized alias -> entity ID table"""
+        return self.store.get_aliases()
+
+    def refresh_database(self) -> None:
+        """Open a fresh store on the database file (picks up a new import)"""
+        self._load_database()
+
+    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+        """Get entity by ID"""
+        return self.store.get_entity_by_id(entity_id)
+
+    def get_entity_by_identifier(self, identifier_type: str, value: str) -> Optional[Entity]:
+        """Case-insensitive lookup on a single identifier column"""
+        return self.store.get_entity_by_identifier(identifier_type, value)
+
+
+def import_excel_to_sqlite(excel_path: Path = MASTER_DB_PATH, db_path: Path = SQLITE_DB_PATH) -> int:
+    """Build the SQLite master from an ``Entities.xlsx`` workbook.
+
+    The file is written next to the target and swapped in atomically, so
+    running handlers keep reading the old file until they refresh.
+    """
+    from .database import DatabaseHandler
+
+    logger = logging.getLogger(__name__)
+    db_path = Path(db_path)
+    source = DatabaseHandler(Path(excel_path))
+    entities = source.get_all_entities()
+
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executemany(
+            "INSERT INTO entities (entity_id, entity_name, ticker, isin, lei, entity_id_upper, "
+            "ticker_upper, isin_upper, lei_upper, name_lower, normalized_name) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    entity.entity_id, entity.entity_name, entity.ticker, entity.isin, entity.lei,
+                    normalize_identifier(entity.entity_id), normalize_identifier(entity.ticker),
+                    normalize_identifier(entity.isin), normalize_identifier(entity.lei),
+                    entity.entity_name.strip().lower(),
+                    normalize_name(entity.entity_name)
+                )
+                for entity in entities
+            )
+        )
+        conn.executemany(
+            "INSERT INTO name_words (word_key, row_id) VALUES (?, ?)",
+            (
+                (word_key, row_id)
+                for row_id, normalized in conn.execute("SELECT row_id, normalized_name FROM entities").fetchall()
+                for word_key in name_word_keys(normalized)
+            )
+        )
+        conn.executemany(
+            "INSERT INTO aliases (alias, entity_id) VALUES (?, ?)",
+            source.get_aliases().items()
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    logger.info(f"Imported {len(entities)} entities into {db_path}")
+    return len(entities)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Import Entities.xlsx into the SQLite master")
+    parser.add_argument("--excel", type=Path, default=MASTER_DB_PATH, help="Source Excel workbook")
+    parser.add_argument("--db", type=Path, default=SQLITE_DB_PATH, help="Target SQLite file")
+    args = parser.parse_args()
+    import_excel_to_sqlite(args.excel, args.db)
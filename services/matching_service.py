@@ -1,26 +1,56 @@
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 import logging
-import pandas as pd
 
 from core.database import DatabaseHandler
-from core.matcher import EntityMatcher
-from core.models import ProcessingResult, MatchResult
+from core.matcher import EntityMatcher, StreamingEntityMatcher
+from core.models import Entity, ProcessingResult, MatchResult
+from core.prefix_index import EntityPrefixIndex
 from utils.file_handlers import FileHandler
+from config.settings import DB_BACKEND
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class MatchingService:
-    def __init__(self, db_path: str = None):
-        self.db_handler = DatabaseHandler(db_path) if db_path else DatabaseHandler()
-        self.matcher = EntityMatcher(self.db_handler.get_all_entities())
+    def __init__(self, db_path: str = None, backend: str = DB_BACKEND):
+        self.backend = backend
+        self.db_handler = self._create_db_handler(db_path)
+        self.matcher = self._create_matcher()
+        self._prefix_index: Optional[EntityPrefixIndex] = None
+        self.database_version = 0  # bumped on refresh so cached results can be invalidated
         self.logger = logging.getLogger(__name__)
         self.file_handler = FileHandler()
     
+    def _create_db_handler(self, db_path: str = None):
+        """Create the database handler for the configured storage backend"""
+        if self.backend == 'sqlite':
+            from core.sqlite_database import SQLiteDatabaseHandler
+            return SQLiteDatabaseHandler(db_path) if db_path else SQLiteDatabaseHandler()
+        if self.backend == 'shared':
+            from core.shared_corpus import SharedCorpusHandler
+            return SharedCorpusHandler(db_path) if db_path else SharedCorpusHandler()
+        if self.backend == 'excel':
+            return DatabaseHandler(db_path) if db_path else DatabaseHandler()
+        raise ValueError(f"Unsupported database backend: {self.backend}")
+    
+    def _create_matcher(self) -> EntityMatcher:
+        """Create a matcher over the current database contents"""
+        # Bind to one store/corpus version so a refresh never closes or mixes rows under a running scan
+        if self.backend == 'sqlite':
+            return StreamingEntityMatcher(self.db_handler.store)
+        if self.backend == 'shared':
+            return StreamingEntityMatcher(self.db_handler.corpus)
+        return EntityMatcher(self.db_handler.get_all_entities(), self.db_handler.get_alias_index())
+    
     def process_input_list(self, input_entities: List[str]) -> ProcessingResult:
         """Process a list of input entities"""
+        self.refresh_if_stale()
         matched_entities = []
         unmatched_entities = []
         
-        for entity in input_entities:
+        for row, entity in enumerate(input_entities, start=1):
             result = self.matcher.match_entity(entity)
+            result.input_row = row
             
             if result.is_match_found():
                 matched_entities.append(result)
@@ -44,25 +74,53 @@ class MatchingService:
     def refresh_database(self) -> None:
         """Refresh the database and update matcher"""
         self.db_handler.refresh_database()
-        self.matcher = EntityMatcher(self.db_handler.get_all_entities())
+        self.matcher = self._create_matcher()
+        self._prefix_index = None
+        self.database_version += 1
         self.logger.info("Database refreshed successfully")
     
-    def get_matched_results_df(self, processing_result: ProcessingResult) -> pd.DataFrame:
+    def refresh_if_stale(self) -> None:
+        """Rebind to a shared corpus version published since the last check (e.g. by another worker)"""
+        if self.backend == 'shared' and self.db_handler.is_stale():
+            self.logger.info("Newer shared corpus version published; refreshing")
+            self.refresh_database()
+    
+    def get_prefix_index(self) -> EntityPrefixIndex:
+        """In-memory typeahead index for the excel backend, built on first use"""
+        if self._prefix_index is None:
+            self._prefix_index = EntityPrefixIndex(self.db_handler.get_all_entities())
+            self.logger.info(f"Built typeahead index over {len(self._prefix_index.entities)} entities")
+        return self._prefix_index
+    
+    def suggest_entities(self, search_type: str, query: str, limit: int) -> List[Entity]:
+        """Typeahead suggestions served from the backend's own storage"""
+        self.refresh_if_stale()
+        if self.backend == 'excel':
+            return self.get_prefix_index().suggest(search_type, query, limit)
+        # The on-disk backends index the same keys; use the store the matcher is bound to
+        return self.matcher.store.suggest(search_type, query, limit)
+    
+    def get_matched_results_df(self, processing_result: ProcessingResult) -> "pd.DataFrame":
         """Convert matched results to DataFrame for display"""
+        import pandas as pd
+        
         results = []
         
         for match in processing_result.matched_entities:
             entity_dict = match.matched_entity.to_dict()
             entity_dict.update({
                 'Input Entity': match.input_entity,
+                'Match Type': match.match_type.title(),
                 'Match Confidence': f"{match.match_confidence:.1f}%"
             })
             results.append(entity_dict)
         
         return pd.DataFrame(results)
     
-    def get_unmatched_results_df(self, processing_result: ProcessingResult) -> pd.DataFrame:
+    def get_unmatched_results_df(self, processing_result: ProcessingResult) -> "pd.DataFrame":
         """Convert unmatched results to DataFrame for display - FIXED confidence"""
+        import pandas as pd
+        
         results = []
         
         for unmatched in processing_result.unmatched_entities:
@@ -71,4 +129,62 @@ class MatchingService:
                 'Best Match Confidence': f"{unmatched.match_confidence:.1f}%"  # Show actual confidence
             })
         
-        return pd.DataFrame(results)
\ No newline at end of file
+        return pd.DataFrame(results)
+    
+    def get_results_frame(self, processing_result: ProcessingResult) -> "pd.DataFrame":
+        """Build one typed DataFrame of all results (numeric confidences) for the paged view"""
+        import pandas as pd
+        
+        results = processing_result.matched_entities + processing_result.unmatched_entities
+        entities = [result.matched_entity for result in results]
+        input_rows = [
+            result.input_row if result.input_row is not None else position
+            for position, result in enumerate(results, start=1)
+        ]
+        
+        frame = pd.DataFrame({
+            'Input Row': pd.Series(input_rows, dtype='int64'),
+            'Input Entity': pd.Series([result.input_entity for result in results], dtype='string'),
+            'Status': pd.Categorical(
+                ['Matched' if entity else 'Unmatched' for entity in entities],
+                categories=['Matched', 'Unmatched']
+            ),
+            'Match Type': pd.Categorical([result.match_type.title() for result in results]),
+            'Match Confidence': pd.Series([result.match_confidence for result in results], dtype='float64'),
+            'Entity ID': pd.Series([entity.entity_id if entity else None for entity in entities], dtype='string'),
+            'Entity Name': pd.Series([entity.entity_name if entity else None for entity in entities], dtype='string'),
+            'Ticker': pd.Series([entity.ticker if entity else None for entity in entities], dtype='string'),
+            'ISIN': pd.Series([entity.isin if entity else None for entity in entities], dtype='string'),
+            'LEI': pd.Series([entity.lei if entity else None for entity in entities], dtype='string'),
+        })
+        # Matched and unmatched results are kept apart; restore the submitted order
+        return frame.sort_values('Input Row', kind='stable', ignore_index=True)
+    
+    def query_results_frame(
+        self,
+        results_df: "pd.DataFrame",
+        status: Optional[str] = None,
+        confidence_range: Tuple[float, float] = (0.0, 100.0),
+        search: str = '',
+        sort_by: Optional[str] = None,
+        ascending: bool = True,
+        page: int = 1,
+        page_size: int = 50
+    ) -> Tuple["pd.DataFrame", int]:
+        """Filter, sort and slice the results frame; returns (page rows, total filtered rows)"""
+        mask = results_df['Match Confidence'].between(*confidence_range)
+        
+        if status:
+            mask &= results_df['Status'] == status
+        
+        if search and search.strip():
+            mask &= results_df['Input Entity'].str.contains(
+                search.strip(), case=False, regex=False, na=False
+            )
+        
+        filtered = results_df[mask]
+        if sort_by:
+            filtered = filtered.sort_values(sort_by, ascending=ascending, kind='stable', na_position='last')
+        
+        start = (max(page, 1) - 1) * page_size
+        return filtered.iloc[start:start + page_size], len(filtered)
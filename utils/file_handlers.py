@@ -1,4 +1,3 @@
-import pandas as pd
 from typing import List
 import logging
 from io import BytesIO
@@ -9,6 +8,8 @@ class FileHandler:
     
     def read_input_file(self, uploaded_file) -> List[str]:
         """Read input file and extract entities"""
+        import pandas as pd
+        
         try:
             if uploaded_file.name.endswith('.csv'):
                 df = pd.read_csv(uploaded_file)
@@ -29,6 +30,8 @@ class FileHandler:
     
     def create_results_excel(self, processing_result, matching_service) -> BytesIO:
         """Create Excel file with matching results"""
+        import pandas as pd
+        
         output = BytesIO()
         
         with pd.ExcelWriter(output, engine='openpyxl') as writer:
@@ -1,6 +1,7 @@
 import logging
 from typing import Optional, Dict, Any
 from core.models import Entity, MatchResult
+from config.settings import TYPEAHEAD_LIMIT, TYPEAHEAD_MIN_FUZZY_CHARS
 
 class LookupHandler:
     def __init__(self, matching_service):
@@ -21,6 +22,7 @@ class LookupHandler:
             
             # Normalize search value
             search_value = search_value.strip()
+            self.matching_service.refresh_if_stale()
             
             # Perform targeted search based on type
             if search_type == 'entity_name':
@@ -40,17 +42,15 @@ class LookupHandler:
     
     def _lookup_by_identifier(self, identifier_type: str, value: str) -> Dict[str, Any]:
         """Lookup by specific identifier (exact match)"""
-        entities = self.matching_service.db_handler.get_all_entities()
+        entity = self.matching_service.db_handler.get_entity_by_identifier(identifier_type, value)
         
-        for entity in entities:
-            identifier_field = getattr(entity, identifier_type, None)
-            if identifier_field and str(identifier_field).strip().upper() == value.upper():
-                return {
-                    'success': True,
-                    'match_found': True,
-                    'entity': entity,
-                    'confidence': 100.0
-                }
+        if entity:
+            return {
+                'success': True,
+                'match_found': True,
+                'entity': entity,
+                'confidence': 100.0
+            }
         
         return {
             'success': True,
@@ -81,6 +81,28 @@ class LookupHandler:
                 'confidence': match_result.match_confidence  # Include confidence for no match
             }
     
+    def get_suggestions(self, search_type: str, query: str) -> Dict[str, Any]:
+        """
+        Typeahead suggestions from the prefix index, falling back to fuzzy
+        name scoring only when the prefix search finds nothing
+        """
+        query = (query or '').strip()
+        if not query:
+            return {'suggestions': [], 'source': 'none'}
+        
+        suggestions = self.matching_service.suggest_entities(search_type, query, TYPEAHEAD_LIMIT)
+        if suggestions:
+            return {'suggestions': suggestions, 'source': 'prefix'}
+        
+        if search_type != 'entity_name' or len(query) < TYPEAHEAD_MIN_FUZZY_CHARS:
+            return {'suggestions': [], 'source': 'none'}
+        
+        match_result = self.matching_service.matcher.match_entity(query)
+        return {
+            'suggestions': [match_result.matched_entity] if match_result.is_match_found() else [],
+            'source': 'fuzzy'
+        }
+    
     def get_available_search_types(self) -> list:
         """Get list of available search types"""
         return [
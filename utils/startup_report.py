@@ -0,0 +1,106 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from config.settings import BASE_DIR, DB_BACKEND
+
+# Modules on the matching path, in dependency order
+MODULES = [
+    'config.settings',
+    'core.models',
+    'core.matcher',
+    'core.prefix_index',
+    'core.database',
+    'core.sqlite_database',
+    'core.shared_corpus',
+    'utils.file_handlers',
+    'utils.lookup_handler',
+    'services.matching_service',
+]
+
+HEAVY_DEPENDENCIES = ['pandas', 'openpyxl', 'streamlit']
+
+_PROBE = (
+    "import sys, json, {module}; "
+    "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+)
+
+
+def measure_import(module: str) -> Dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and report its cumulative import time"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, heavy=HEAVY_DEPENDENCIES)],
+        cwd=BASE_DIR, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        stderr_lines = [
+            line for line in completed.stderr.strip().splitlines() if not line.startswith("import time:")
+        ]
+        error = stderr_lines[-1] if stderr_lines else f"exited with code {completed.returncode}"
+        return {'module': module, 'error': error}
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package"
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split('|')]
+        if parts[2] == module:
+            cumulative_us = int(parts[1])
+
+    return {
+        'module': module,
+        'import_ms': cumulative_us / 1000 if cumulative_us is not None else None,
+        'heavy_loaded': json.loads(completed.stdout.strip().splitlines()[-1]),
+    }
+
+
+def measure_load(backend: str) -> List[Dict[str, Any]]:
+    """Time building the matching service and serving the first typeahead query in this process"""
+    from services.matching_service import MatchingService
+
+    timings = []
+    start = time.perf_counter()
+    service = MatchingService(backend=backend)
+    timings.append({'step': f"MatchingService(backend={backend!r})", 'ms': (time.perf_counter() - start) * 1000})
+
+    # Includes building the in-memory index on the excel backend
+    start = time.perf_counter()
+    service.suggest_entities('entity_name', 'a', 10)
+    timings.append({'step': "first typeahead query", 'ms': (time.perf_counter() - start) * 1000})
+    return timings
+
+
+def print_report(imports: List[Dict[str, Any]], loads: List[Dict[str, Any]]) -> None:
+    print(f"{'module':<28} {'import ms':>10}  heavy deps loaded")
+    for row in imports:
+        if 'error' in row:
+            print(f"{row['module']:<28} {'error':>10}  {row['error']}")
+            continue
+        import_ms = f"{row['import_ms']:.1f}" if row['import_ms'] is not None else '-'
+        print(f"{row['module']:<28} {import_ms:>10}  {', '.join(row['heavy_loaded']) or '-'}")
+
+    if loads:
+        print()
+        print(f"{'load step':<38} {'ms':>10}")
+        for row in loads:
+            print(f"{row['step']:<38} {row['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report per-module import and load costs")
+    parser.add_argument("--backend", default=DB_BACKEND, help="Database backend to time loading for")
+    parser.add_argument("--imports-only", action="store_true", help="Skip loading the database")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    imports = [measure_import(module) for module in MODULES]
+    loads = [] if args.imports_only else measure_load(args.backend)
+
+    if args.json:
+        print(json.dumps({'imports': imports, 'loads': loads}, indent=2))
+    else:
+        print_report(imports, loads)